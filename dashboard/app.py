@@ -0,0 +1,239 @@
+"""Flask dashboard for running scrapes and browsing results."""
+
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from flask import Flask, jsonify, render_template, request
+from flask_compress import Compress
+
+from src.autoscore import AutoScore
+from src.config import Config, get_config
+from src.exporter import Exporter
+from src.notifier import Notifier
+from src.scraper import Scraper
+
+app = Flask(__name__)
+app.config["COMPRESS_MIN_SIZE"] = 500
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+Compress(app)
+
+dashboard_state = {
+    "scraping": False,
+    "progress": 0,
+    "details": "",
+    "results": None,
+}
+dashboard_state_lock = threading.Lock()
+
+# Immutable (progress, details, scraping) tuple replaced atomically by the
+# writer, so the hot /progress poll can read it without taking the lock.
+_progress_snapshot = (0, "", False)
+
+# Rendered-HTML caches: /all-time-bests is keyed on the best-cars file mtime,
+# /results on a content hash of the rows actually rendered.
+_bests_cache = {"mtime": None, "html": None}
+_bests_cache_lock = threading.Lock()
+_results_cache = {"key": None, "html": None}
+_results_cache_lock = threading.Lock()
+
+SORT_METHODS = ["standard", "price", "age"]
+
+# The scrape job mixes network I/O with pandas scoring; running it in a
+# single-worker subprocess keeps that CPU off the web process entirely.
+_scrape_executor = None
+_progress_manager = None
+
+
+def _get_scrape_executor():
+    global _scrape_executor, _progress_manager
+    if _scrape_executor is None:
+        # Spawn, not fork: the executor is created lazily from a request
+        # thread while waitress runs several others, and forking a
+        # multi-threaded process can inherit a lock held mid-operation.
+        context = multiprocessing.get_context("spawn")
+        _scrape_executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+        _progress_manager = context.Manager()
+    return _scrape_executor
+
+
+def _publish_progress():
+    """Republish the progress fields as one atomically-swapped tuple.
+
+    Must be called with ``dashboard_state_lock`` held.
+    """
+    global _progress_snapshot
+    _progress_snapshot = (
+        dashboard_state["progress"],
+        dashboard_state["details"],
+        dashboard_state["scraping"],
+    )
+
+
+def get_table_html(df):
+    """Render a DataFrame as the HTML table used by the dashboard views."""
+    return df.to_html(classes="car-table", index=False, escape=False)
+
+
+def run_scrape(progress_queue=None):
+    """Scrape with every sort method, score and return the ranked cars.
+
+    Runs in the worker subprocess; progress is reported as ``(progress,
+    details)`` tuples on ``progress_queue``.
+    """
+
+    def report(progress_value, details):
+        if progress_queue is not None:
+            progress_queue.put((progress_value, details))
+
+    # A fresh Config, not get_config(): the worker process is reused across
+    # jobs and its lru_cache never sees the web process's cache_clear(), so
+    # the cached copy would pin pre-edit settings forever. load_settings'
+    # mtime-keyed cache keeps this cheap.
+    config = Config()
+    scraper = Scraper(config)
+    for index, sort_method in enumerate(SORT_METHODS):
+        report(int(100 * index / len(SORT_METHODS)), f"Scraping ({sort_method})")
+        cars = scraper.scrape_data(sort_method=sort_method)
+        Exporter(cars).export_to_csv(
+            f"{config.results_folder}/filtered_cars_{sort_method}.csv"
+        )
+    report(90, "Scoring")
+    scorer = AutoScore(config.results_folder)
+    top_cars = scorer.rank_cars(config.num_best_cars)
+    scorer.save_best_cars(top_cars, config.best_cars_file)
+    return top_cars
+
+
+def _watch_scrape(future, progress_queue):
+    """Drain progress updates into the dashboard state and collect the result."""
+    while not future.done():
+        try:
+            progress_value, details = progress_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        with dashboard_state_lock:
+            dashboard_state["progress"] = progress_value
+            dashboard_state["details"] = details
+            _publish_progress()
+    try:
+        top_cars = future.result()
+        with dashboard_state_lock:
+            dashboard_state["results"] = top_cars
+            dashboard_state["progress"] = 100
+            dashboard_state["details"] = "Done"
+            _publish_progress()
+    except Exception as error:  # noqa: BLE001 - surface any failure to the UI
+        with dashboard_state_lock:
+            dashboard_state["details"] = f"Error: {error}"
+            _publish_progress()
+    finally:
+        with dashboard_state_lock:
+            dashboard_state["scraping"] = False
+            _publish_progress()
+
+
+@app.route("/")
+def index():
+    return render_template("index.html")
+
+
+@app.route("/start-scrape", methods=["POST"])
+def start_scrape():
+    with dashboard_state_lock:
+        if dashboard_state["scraping"]:
+            return jsonify({"status": "already running"})
+        dashboard_state["scraping"] = True
+        dashboard_state["progress"] = 0
+        dashboard_state["details"] = "Starting"
+        _publish_progress()
+    executor = _get_scrape_executor()
+    progress_queue = _progress_manager.Queue()
+    future = executor.submit(run_scrape, progress_queue)
+    threading.Thread(
+        target=_watch_scrape, args=(future, progress_queue), daemon=True
+    ).start()
+    return jsonify({"status": "started"})
+
+
+@app.route("/progress")
+def progress():
+    progress_value, details, scraping = _progress_snapshot
+    return jsonify(
+        {"progress": progress_value, "details": details, "scraping": scraping}
+    )
+
+
+@app.route("/results")
+def results():
+    with dashboard_state_lock:
+        df = dashboard_state["results"]
+    if df is None:
+        return "<p>No results yet.</p>"
+    head = df.head(20)
+    key = (len(df), int(pd.util.hash_pandas_object(head, index=False).sum()))
+    with _results_cache_lock:
+        if _results_cache["key"] == key:
+            return _results_cache["html"]
+        html = get_table_html(head)
+        _results_cache["key"] = key
+        _results_cache["html"] = html
+    return html
+
+
+@app.route("/all-time-bests")
+def all_time_bests():
+    config = get_config()
+    try:
+        mtime = os.path.getmtime(config.best_cars_file)
+    except OSError:
+        mtime = None
+    with _bests_cache_lock:
+        if mtime is not None and _bests_cache["mtime"] == mtime:
+            return _bests_cache["html"]
+        best = AutoScore.get_all_time_best(config.best_cars_file)
+        if best.empty:
+            return "<p>No best cars saved yet.</p>"
+        html = get_table_html(best.head(20))
+        _bests_cache["mtime"] = mtime
+        _bests_cache["html"] = html
+    return html
+
+
+@app.route("/config", methods=["GET", "POST"])
+def config_view():
+    config = get_config()
+    if request.method == "POST":
+        payload = request.get_json(silent=True) or {}
+        config.filters.update(payload.get("filters", {}))
+        config.email_settings.update(payload.get("email_settings", {}))
+        config.save()
+        get_config.cache_clear()
+        return jsonify({"status": "saved"})
+    return jsonify(
+        {"filters": config.filters, "email_settings": config.email_settings}
+    )
+
+
+@app.route("/notify", methods=["POST"])
+def notify():
+    with dashboard_state_lock:
+        df = dashboard_state["results"]
+    if df is None:
+        return jsonify({"status": "no results to send"}), 400
+    Notifier(get_config()).send_email(df)
+    return jsonify({"status": "sent"})
+
+
+if __name__ == "__main__":
+    if os.environ.get("FLASK_DEBUG") == "1":
+        # Development only: debugger without the memory-doubling reloader.
+        app.run(host="0.0.0.0", port=5000, debug=True, use_reloader=False)
+    else:
+        from waitress import serve
+
+        serve(app, host="0.0.0.0", port=5000, threads=8)
@@ -0,0 +1,131 @@
+"""Numba-compiled scoring kernel operating on struct-of-arrays buffers.
+
+The kernel receives one contiguous 1-D array per scoring input plus the
+weights and normalization ranges, so the whole score is computed without
+touching any Python objects. When numba is not installed ``score_kernel``
+is ``None`` and :class:`src.autoscore.AutoScore` falls back to its
+pandas-based scorer.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+    prange = range
+
+# Index layout of the ``weights`` argument.
+W_PRICE = 0
+W_MILEAGE = 1
+W_POWER = 2
+W_YEAR = 3
+W_FUEL = 4
+W_FEATURES = 5
+W_BODY = 6
+W_EMISSION = 7
+W_COOLNESS = 8
+W_WARRANTY = 9
+
+# Index layout of the ``mins``/``invs`` arguments.
+R_PRICE = 0
+R_MILEAGE = 1
+R_POWER = 2
+R_YEAR = 3
+
+
+def _score_kernel(
+    price,
+    mileage,
+    power_hp,
+    year,
+    fuel_score,
+    android,
+    carplay,
+    acc,
+    heat,
+    body_ok,
+    emi6,
+    emi5,
+    fav,
+    warranty_ok,
+    prev_owner,
+    no_service,
+    no_smoke,
+    weights,
+    mins,
+    invs,
+):
+    n = price.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        # ``invs`` holds precomputed 1/(max-min) reciprocals (0 when the
+        # range is degenerate, collapsing the term to the full weight), so
+        # each normalization is a branch-free multiply-add. Values never
+        # fall below the dataset minimum, so no abs is needed.
+        score = 0.0
+        score += weights[W_PRICE] * (
+            1.0 - (price[i] - mins[R_PRICE]) * invs[R_PRICE]
+        )
+        score += weights[W_MILEAGE] * (
+            1.0 - (mileage[i] - mins[R_MILEAGE]) * invs[R_MILEAGE]
+        )
+        score += weights[W_POWER] * (
+            1.0 - (power_hp[i] - mins[R_POWER]) * invs[R_POWER]
+        )
+        score += weights[W_YEAR] * (
+            1.0 - (year[i] - mins[R_YEAR]) * invs[R_YEAR]
+        )
+        score += weights[W_FUEL] * fuel_score[i]
+        if android[i] and carplay[i]:
+            score += weights[W_FEATURES]
+        if acc[i]:
+            score += 1.0
+        if heat[i]:
+            score += 1.0
+        if body_ok[i]:
+            score += weights[W_BODY]
+        if emi6[i]:
+            score += weights[W_EMISSION]
+        elif emi5[i]:
+            score += weights[W_EMISSION] * 0.8
+        if fav[i]:
+            score += weights[W_COOLNESS]
+        if warranty_ok[i]:
+            score += weights[W_WARRANTY]
+        if prev_owner[i] == 1:
+            score += 1.0
+        elif prev_owner[i] == 2:
+            score += 1.5
+        if no_service[i]:
+            score -= 2.0
+        if no_smoke[i]:
+            score -= 1.0
+        out[i] = score
+    return out
+
+
+def _kernel_signature():
+    """Explicit signature so the kernel compiles eagerly at import time.
+
+    The inputs are declared readonly because pandas hands out read-only
+    array views under copy-on-write; writable arrays still match.
+    """
+    from numba import types
+
+    f64 = types.Array(types.float64, 1, "C", readonly=True)
+    boolean = types.Array(types.bool_, 1, "C", readonly=True)
+    args = (
+        [f64] * 5  # price, mileage, power_hp, year, fuel_score
+        + [boolean] * 9  # android..emi5, fav, warranty_ok
+        + [f64]  # prev_owner
+        + [boolean] * 2  # no_service, no_smoke
+        + [f64] * 3  # weights, mins, invs
+    )
+    return types.Array(types.float64, 1, "C")(*args)
+
+
+if njit is not None:
+    score_kernel = njit(_kernel_signature(), parallel=True, cache=True)(_score_kernel)
+else:  # pragma: no cover - exercised only without numba
+    score_kernel = None
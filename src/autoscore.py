@@ -0,0 +1,494 @@
+"""Scoring and ranking of scraped cars."""
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src._score_kernel import score_kernel
+from src.constants import (
+    FAVORITE_EXACT,
+    FAVORITE_MODELS,
+    FAVORITE_WILDCARD_MAKES,
+    FUEL_SCORES,
+    WEIGHTS,
+)
+
+# The only columns scoring and ranking ever touch; loading just these keeps
+# CSV parse time and memory proportional to what is actually used.
+SCORE_COLUMNS = [
+    "url",
+    "make",
+    "model",
+    "price",
+    "mileage",
+    "year",
+    "power",
+    "fuel_type",
+    "body_type",
+    "emission_class",
+    "warranty",
+    "previous_owner",
+    "full_service_history",
+    "non_smoker_vehicle",
+    "android_auto",
+    "car_play",
+    "adaptive_cruise_control",
+    "seat_heating",
+]
+
+# Numeric columns with the narrowest dtype that fits their value range;
+# halving the byte width roughly doubles throughput of the scoring pass.
+NUMERIC_DTYPES = {
+    "price": "float32",
+    "mileage": "int32",
+    "year": "int16",
+    "vehicle_mileage": "int32",
+    "seats": "int16",
+    "doors": "int16",
+    "previous_owner": "int16",
+    "gears": "int16",
+    "cylinders": "int16",
+}
+STRING_COLUMNS = [
+    "make",
+    "model",
+    "fuel_type",
+    "body_type",
+    "emission_class",
+    "warranty",
+    "full_service_history",
+    "non_smoker_vehicle",
+    "power",
+    "gearbox",
+    "engine_size",
+    "type",
+    "country_version",
+    "offer_number",
+    "first_registration",
+    "url",
+    "image_url",
+    "scraped_at",
+]
+BOOLEAN_COLUMNS = [
+    "android_auto",
+    "car_play",
+    "cruise_control",
+    "adaptive_cruise_control",
+    "seat_heating",
+]
+
+# Columns compared case-insensitively by the scorer; lowercased once at load.
+LOWERCASE_COLUMNS = [
+    "make",
+    "model",
+    "fuel_type",
+    "body_type",
+    "emission_class",
+    "warranty",
+    "full_service_history",
+    "non_smoker_vehicle",
+]
+
+GOOD_BODY_TYPES = ["station wagon", "off-road/pick-up", "sedan"]
+
+# Grade boundaries: a score of bin[i] < s <= bin[i+1] earns labels[i].
+GRADE_BINS = [-np.inf, 9, 14, 19, 24, 28, np.inf]
+GRADE_LABELS = ["Bad", "Not Good", "Decent", "Good", "Excellent", "Outstanding"]
+
+
+class AutoScore:
+    """Loads scraped results, scores each car and ranks the best ones."""
+
+    def __init__(self, data_folder="data/results"):
+        csv_files = sorted(glob.glob(os.path.join(data_folder, "*.csv")))
+        if not csv_files:
+            raise FileNotFoundError(f"No result CSV files found in {data_folder}")
+        self._init_from_data(self._load_results(csv_files))
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Build a scorer from in-memory result frames, skipping the CSV
+        round-trip.
+
+        ``frames`` is a mapping of sort method to DataFrame (or any
+        iterable of DataFrames); rows are concatenated and deduplicated on
+        url exactly like the on-disk shards.
+        """
+        if isinstance(frames, dict):
+            frames = list(frames.values())
+        data = (
+            pd.concat(frames, ignore_index=True)
+            .drop_duplicates(subset=["url"])
+            .reset_index(drop=True)
+        )
+        scorer = cls.__new__(cls)
+        scorer._init_from_data(data)
+        return scorer
+
+    def _init_from_data(self, data):
+        """Shared post-load preparation: defaults, dtypes and ranges."""
+        self.data = data
+        numeric_columns = [c for c in NUMERIC_DTYPES if c in self.data.columns]
+        self.data[numeric_columns] = self.data[numeric_columns].apply(
+            pd.to_numeric, errors="coerce"
+        )
+        # One fillna traversal for every column instead of a pass per column.
+        fill_values = {column: 0 for column in numeric_columns}
+        fill_values |= {
+            column: "" for column in STRING_COLUMNS if column in self.data.columns
+        }
+        fill_values |= {
+            column: False
+            for column in BOOLEAN_COLUMNS
+            if column in self.data.columns
+        }
+        self.data = self.data.fillna(fill_values)
+        self.data = self.data.astype(
+            {column: NUMERIC_DTYPES[column] for column in numeric_columns}
+        )
+        # Lowercase once, then store as category: these columns have few
+        # distinct values, so comparisons and groupbys run on integer codes.
+        for column in LOWERCASE_COLUMNS:
+            if column in self.data.columns:
+                self.data[column] = (
+                    self.data[column].astype(str).str.lower().astype("category")
+                )
+        self._power_hp = self._parse_power_hp(self.data["power"])
+        self.fuel_scores = FUEL_SCORES
+        self.favorite_models = FAVORITE_MODELS
+        self._fav_exact = FAVORITE_EXACT
+        self._fav_wildcard_makes = FAVORITE_WILDCARD_MAKES
+        self.weights = WEIGHTS
+        self._weights_arr = np.array(
+            [
+                WEIGHTS["price"],
+                WEIGHTS["mileage"],
+                WEIGHTS["power"],
+                WEIGHTS["year"],
+                WEIGHTS["fuel_type"],
+                WEIGHTS["features"],
+                WEIGHTS["body_type"],
+                WEIGHTS["emission_class"],
+                WEIGHTS["coolness"],
+                WEIGHTS["warranty"],
+            ],
+            dtype=np.float64,
+        )
+        self._calculate_ranges()
+
+    @staticmethod
+    def _load_results(csv_files):
+        """Read the result shards into one url-deduplicated frame.
+
+        With few shards, rows whose url was already seen are dropped while
+        streaming so duplicate rows are never carried into the concat. Beyond
+        eight shards a pyarrow dataset scans all files without materializing
+        intermediate frames, with one dedup pass at the end.
+        """
+        if len(csv_files) > 8:
+            import pyarrow.dataset as ds
+
+            table = ds.dataset(csv_files, format="csv").to_table(
+                columns=SCORE_COLUMNS
+            )
+            # Dedup on the dictionary-encoded url column: first occurrences
+            # are found by hashing int32 codes instead of full URL strings,
+            # and only the surviving rows are ever converted to pandas.
+            url_codes = (
+                table.column("url").dictionary_encode().combine_chunks().indices
+            )
+            _, first_rows = np.unique(url_codes.to_numpy(), return_index=True)
+            return table.take(np.sort(first_rows)).to_pandas()
+        def read_shard(csv_file):
+            return pd.read_csv(csv_file, usecols=SCORE_COLUMNS, engine="pyarrow")
+
+        # The pyarrow parser releases the GIL, so shard reads overlap in a
+        # thread pool; map preserves file order for the dedup pass below.
+        with ThreadPoolExecutor(max_workers=min(8, len(csv_files))) as executor:
+            parts = list(executor.map(read_shard, csv_files))
+        seen_urls = set()
+        frames = []
+        for part in parts:
+            part = part.drop_duplicates(subset=["url"])
+            part = part[~part["url"].isin(seen_urls)]
+            seen_urls.update(part["url"].tolist())
+            frames.append(part)
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _parse_power_hp(power):
+        """Parse the leading number out of a ``power`` column, 0 when absent."""
+        return (
+            power.astype(str)
+            .str.extract(r"^\s*(\d+)", expand=False)
+            .fillna("0")
+            .astype(np.int32)
+        )
+
+    def _calculate_ranges(self):
+        """Record the min/max of every normalized column."""
+        ranges = self.data[["price", "mileage", "year"]].agg(["min", "max"])
+        self.price_min = ranges.loc["min", "price"]
+        self.price_max = ranges.loc["max", "price"]
+        self.mileage_min = ranges.loc["min", "mileage"]
+        self.mileage_max = ranges.loc["max", "mileage"]
+        self.year_min = ranges.loc["min", "year"]
+        self.year_max = ranges.loc["max", "year"]
+        self.power_min = int(self._power_hp.min())
+        self.power_max = int(self._power_hp.max())
+        self._range_mins = np.array(
+            [self.price_min, self.mileage_min, self.power_min, self.year_min],
+            dtype=np.float64,
+        )
+        # Precomputed 1/(max-min) per normalized column (0 when degenerate):
+        # the kernel multiplies instead of dividing per element.
+        self._range_invs = np.array(
+            [
+                self._inv_range(self.price_min, self.price_max),
+                self._inv_range(self.mileage_min, self.mileage_max),
+                self._inv_range(self.power_min, self.power_max),
+                self._inv_range(self.year_min, self.year_max),
+            ],
+            dtype=np.float64,
+        )
+
+    @staticmethod
+    def _inv_range(min_val, max_val):
+        """Reciprocal of a range, or 0.0 when the range is degenerate."""
+        return 1.0 / (max_val - min_val) if max_val > min_val else 0.0
+
+    def normalize(self, value, min_val, max_val):
+        """Map a value onto [0, 1] where the minimum of the range is best."""
+        if max_val == min_val:
+            return 1.0
+        return 1 - abs(value - min_val) / (max_val - min_val)
+
+    def _vectorized_score(self, df):
+        """Compute the score of every row at once.
+
+        The string-derived components are reduced to flat boolean/float
+        columns first; the arithmetic then runs in the compiled kernel when
+        numba is available, or as pandas column operations otherwise.
+        """
+        if df.index.equals(self._power_hp.index):
+            power_hp = self._power_hp
+        else:
+            power_hp = self._parse_power_hp(df["power"])
+        fuel = df["fuel_type"]
+        if isinstance(fuel.dtype, pd.CategoricalDtype):
+            # Tiny lookup table indexed by category code: one contiguous
+            # array load per row instead of a hash lookup per row.
+            fuel_lut = np.array(
+                [self.fuel_scores.get(c, 0.0) for c in fuel.cat.categories],
+                dtype=np.float64,
+            )
+            codes = fuel.cat.codes.to_numpy()
+            fuel_score = pd.Series(
+                np.where(codes >= 0, fuel_lut[codes], 0.0), index=df.index
+            )
+        else:
+            fuel_score = fuel.map(self.fuel_scores).fillna(0).astype(np.float64)
+        android = df["android_auto"].astype(bool)
+        carplay = df["car_play"].astype(bool)
+        acc = df["adaptive_cruise_control"].astype(bool)
+        heat = df["seat_heating"].astype(bool)
+        body_ok = df["body_type"].isin(GOOD_BODY_TYPES)
+        # The needles are literals and the columns lowercased at load, so
+        # regex compilation and case folding are both skipped.
+        emission = df["emission_class"]
+        emi6 = emission.str.contains("6", regex=False, na=False)
+        emi5 = emission.str.contains("5", regex=False, na=False)
+        # A favorite is either an exact (make, model) entry or any model of
+        # a wildcard make; the old check compared the listing's model against
+        # the literal "x" and never matched wildcard entries.
+        favorite = (
+            pd.MultiIndex.from_arrays([df["make"], df["model"]]).isin(
+                self._fav_exact
+            )
+            | df["make"].isin(self._fav_wildcard_makes).to_numpy()
+        )
+        warranty_no = df["warranty"].str.contains("no", regex=False, na=False)
+        no_service = df["full_service_history"].str.contains(
+            "no", regex=False, na=False
+        )
+        no_smoke = df["non_smoker_vehicle"].str.contains("no", regex=False, na=False)
+        owners = df["previous_owner"]
+
+        if score_kernel is not None:
+            scores = score_kernel(
+                np.ascontiguousarray(df["price"].to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(df["mileage"].to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(power_hp.to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(df["year"].to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(fuel_score.to_numpy(), dtype=np.float64),
+                android.to_numpy(),
+                carplay.to_numpy(),
+                acc.to_numpy(),
+                heat.to_numpy(),
+                body_ok.to_numpy(),
+                emi6.to_numpy(),
+                emi5.to_numpy(),
+                np.ascontiguousarray(favorite),
+                (~warranty_no).to_numpy(),
+                np.ascontiguousarray(owners.to_numpy(), dtype=np.float64),
+                no_service.to_numpy(),
+                no_smoke.to_numpy(),
+                self._weights_arr,
+                self._range_mins,
+                self._range_invs,
+            )
+            return pd.Series(scores, index=df.index)
+
+        # One fused expression instead of four normalize passes: numexpr
+        # evaluates it without materializing a temporary per operation. A
+        # degenerate range has inv_range 0, which makes the term collapse to
+        # the full weight, matching normalize()'s max == min case.
+        normalized = pd.eval(
+            "w_price * (1 - (price - price_min) * price_inv)"
+            " + w_mileage * (1 - (mileage - mileage_min) * mileage_inv)"
+            " + w_power * (1 - (power - power_min) * power_inv)"
+            " + w_year * (1 - (year - year_min) * year_inv)",
+            local_dict={
+                "price": df["price"].to_numpy(dtype=np.float64),
+                "mileage": df["mileage"].to_numpy(dtype=np.float64),
+                "power": power_hp.to_numpy(dtype=np.float64),
+                "year": df["year"].to_numpy(dtype=np.float64),
+                "price_min": self.price_min,
+                "mileage_min": self.mileage_min,
+                "power_min": self.power_min,
+                "year_min": self.year_min,
+                "price_inv": self._range_invs[0],
+                "mileage_inv": self._range_invs[1],
+                "power_inv": self._range_invs[2],
+                "year_inv": self._range_invs[3],
+                "w_price": self.weights["price"],
+                "w_mileage": self.weights["mileage"],
+                "w_power": self.weights["power"],
+                "w_year": self.weights["year"],
+            },
+        )
+        score = pd.Series(normalized, index=df.index)
+        score += self.weights["fuel_type"] * fuel_score
+        score += self.weights["features"] * (android & carplay)
+        score += acc.astype(float)
+        score += heat.astype(float)
+        score += self.weights["body_type"] * body_ok
+        score += np.where(
+            emi6,
+            self.weights["emission_class"],
+            np.where(emi5, self.weights["emission_class"] * 0.8, 0.0),
+        )
+        score += self.weights["coolness"] * favorite
+        score += self.weights["warranty"] * ~warranty_no
+        score += (owners == 1) * 1.0 + (owners == 2) * 1.5
+        score -= 2 * no_service
+        score -= 1 * no_smoke
+        return score
+
+    def assign_grade(self, score):
+        """Translate a single numeric score into a human-readable grade.
+
+        Ranking grades whole columns with :func:`pandas.cut` over the same
+        ``GRADE_BINS``; this stays for one-off scores.
+        """
+        for upper, label in zip(GRADE_BINS[1:], GRADE_LABELS):
+            if score <= upper:
+                return label
+        return GRADE_LABELS[-1]
+
+    def _score_and_rank_data(self, data, num_cars):
+        """Score every row, then pick the top cars preferring unique models."""
+        data = data.copy()
+        data["score"] = self._vectorized_score(data).round(1)
+        data["grade"] = pd.cut(data["score"], bins=GRADE_BINS, labels=GRADE_LABELS)
+        # On large datasets, select from a small top-score shortlist first;
+        # the full frame is only consulted when the shortlist does not hold
+        # enough distinct models.
+        shortlist_size = max(num_cars * 5, 200)
+        if len(data) > shortlist_size:
+            shortlist = self._pick_top(data.nlargest(shortlist_size, "score"), num_cars)
+            if len(shortlist) == num_cars and not shortlist.duplicated(
+                subset=["make", "model"]
+            ).any():
+                return shortlist
+        return self._pick_top(data, num_cars)
+
+    def _pick_top(self, data, num_cars):
+        """Pick the ``num_cars`` best rows, preferring one per (make, model)."""
+        best_idx = data.groupby(["make", "model"], sort=False, observed=True)[
+            "score"
+        ].idxmax()
+        unique_cars = data.loc[best_idx]
+        if len(unique_cars) >= num_cars:
+            return unique_cars.nlargest(num_cars, "score").reset_index(drop=True)
+        # Fewer distinct models than requested: one walk over the sorted
+        # frame collects every per-model best plus the highest-scoring
+        # duplicates, replacing the isin mask and concat copy.
+        sorted_data = data.sort_values(by="score", ascending=False, kind="stable")
+        total_pairs = len(best_idx)
+        fill_quota = num_cars - total_pairs
+        seen_pairs = set()
+        unique_pos = []
+        duplicate_pos = []
+        for pos, pair in enumerate(
+            zip(sorted_data["make"].to_numpy(), sorted_data["model"].to_numpy())
+        ):
+            if pair not in seen_pairs:
+                seen_pairs.add(pair)
+                unique_pos.append(pos)
+            elif len(duplicate_pos) < fill_quota:
+                duplicate_pos.append(pos)
+            if len(unique_pos) == total_pairs and len(duplicate_pos) == fill_quota:
+                break
+        return sorted_data.iloc[unique_pos + duplicate_pos].reset_index(drop=True)
+
+    def rank_cars(self, num_cars=10):
+        """Return the top ``num_cars`` cars across all loaded results."""
+        return self._score_and_rank_data(self.data, num_cars)
+
+    @staticmethod
+    def get_all_time_best(best_cars_file="data/best_cars.csv", num_cars=20):
+        """Return the top cars from the persisted best-cars history."""
+        if not os.path.exists(best_cars_file):
+            return pd.DataFrame()
+        best = pd.read_csv(best_cars_file)
+        best_idx = best.groupby(["make", "model"], sort=False, observed=True)[
+            "score"
+        ].idxmax()
+        return best.loc[best_idx].nlargest(num_cars, "score").reset_index(drop=True)
+
+    def save_best_cars(self, top_cars, best_cars_file="data/best_cars.csv", max_rows=300):
+        """Append the latest top cars to the persisted best-cars log.
+
+        The log is append-only on the hot path; duplicates and overflow are
+        cleaned up by :meth:`compact_best_cars` once the file has grown past
+        twice ``max_rows``.
+        """
+        directory = os.path.dirname(best_cars_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_exists = os.path.exists(best_cars_file)
+        top_cars.to_csv(
+            best_cars_file, mode="a", header=not file_exists, index=False
+        )
+        self.compact_best_cars(best_cars_file, max_rows)
+
+    @staticmethod
+    def compact_best_cars(best_cars_file, max_rows=300):
+        """Sort, dedupe and truncate the best-cars log once it is oversized."""
+        with open(best_cars_file, encoding="utf-8") as log_file:
+            total_rows = sum(1 for _ in log_file) - 1
+        if total_rows <= 2 * max_rows:
+            return
+        combined = pd.read_csv(best_cars_file)
+        if "score" not in combined.columns:
+            combined["score"] = 0
+        combined = (
+            combined.sort_values(by="score", ascending=False, kind="stable")
+            .drop_duplicates(subset=["url"])
+            .head(max_rows)
+        )
+        combined.to_csv(best_cars_file, index=False)
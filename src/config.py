@@ -0,0 +1,95 @@
+"""Runtime configuration for the scraper, scorer and notifier."""
+
+import functools
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from types import MappingProxyType
+
+SETTINGS_PATH = "data/settings.json"
+
+# Immutable default mappings shared by every Config instance; the factories
+# hand out cheap shallow copies instead of rebuilding literals per instance.
+_DEFAULT_FILTERS = MappingProxyType(
+    {
+        "brands": (),
+        "min_price": 3000,
+        "max_price": 20000,
+        "min_year": 2015,
+        "max_mileage": 150000,
+    }
+)
+_DEFAULT_EMAIL_SETTINGS = MappingProxyType(
+    {
+        "smtp_server": "smtp.gmail.com",
+        "smtp_port": 587,
+        "sender": "",
+        "password": "",
+        "receiver": "",
+    }
+)
+
+
+def _default_filters():
+    filters = dict(_DEFAULT_FILTERS)
+    filters["brands"] = list(filters["brands"])
+    return filters
+
+
+@functools.lru_cache(maxsize=4)
+def _load_settings_cached(settings_path, mtime):
+    # mtime participates in the cache key, so edits to the file invalidate
+    # the entry automatically.
+    del mtime
+    with open(settings_path, encoding="utf-8") as settings_file:
+        return json.load(settings_file)
+
+
+def load_settings(settings_path=SETTINGS_PATH):
+    """Load user settings from disk, returning an empty dict when absent."""
+    try:
+        mtime = os.path.getmtime(settings_path)
+    except OSError:
+        return {}
+    return _load_settings_cached(settings_path, mtime)
+
+
+@dataclass(slots=True)
+class Config:
+    """Holds all tunable knobs; user overrides come from ``data/settings.json``."""
+
+    base_url: str = "https://www.autoscout24.com"
+    num_pages: int = 3
+    num_best_cars: int = 10
+    results_folder: str = "data/results"
+    best_cars_file: str = "data/best_cars.csv"
+    filters: dict = field(default_factory=_default_filters)
+    email_settings: dict = field(
+        default_factory=lambda: dict(_DEFAULT_EMAIL_SETTINGS)
+    )
+
+    def __post_init__(self):
+        settings = load_settings()
+        self.filters.update(settings.get("filters", {}))
+        self.email_settings.update(settings.get("email_settings", {}))
+        if "num_pages" in settings:
+            self.num_pages = settings["num_pages"]
+        if "num_best_cars" in settings:
+            self.num_best_cars = settings["num_best_cars"]
+
+    def save(self, settings_path=SETTINGS_PATH):
+        """Persist the current configuration as the user settings file."""
+        os.makedirs(os.path.dirname(settings_path), exist_ok=True)
+        with open(settings_path, "w", encoding="utf-8") as settings_file:
+            json.dump(asdict(self), settings_file, indent=2)
+
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """Process-wide cached :class:`Config`.
+
+    Callers on hot paths (the dashboard routes poll this) should prefer this
+    over constructing ``Config()`` so the settings file is not re-read per
+    request. Call ``get_config.cache_clear()`` after saving new settings.
+    """
+    return Config()
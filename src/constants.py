@@ -0,0 +1,110 @@
+"""Shared constants used across the scraper, scorer and utilities."""
+
+# Makes kept when building the makes/models CSV from the AutoScout24 taxonomy.
+# The tuple keeps a stable order for serialization; membership tests go
+# through the frozenset below.
+FILTER_MAKES = (
+    "Audi",
+    "BMW",
+    "Citroen",
+    "Dacia",
+    "Fiat",
+    "Ford",
+    "Honda",
+    "Hyundai",
+    "Kia",
+    "Mazda",
+    "Mercedes-Benz",
+    "Nissan",
+    "Opel",
+    "Peugeot",
+    "Renault",
+    "Seat",
+    "Skoda",
+    "Suzuki",
+    "Toyota",
+    "Volkswagen",
+    "Volvo",
+)
+
+FILTER_MAKES_SET = frozenset(FILTER_MAKES)
+
+# Models we never want in the results, grouped by (lowercase) make.
+EXCLUDED_CARS = {
+    "citroen": frozenset({"berlingo", "jumpy"}),
+    "fiat": frozenset({"doblo", "qubo"}),
+    "ford": frozenset({"tourneo connect", "transit"}),
+    "hyundai": frozenset({"h-1", "staria"}),
+    "opel": frozenset({"combo", "meriva", "zafira"}),
+    "peugeot": frozenset({"partner", "rifter"}),
+    "renault": frozenset({"express", "kangoo"}),
+    "volkswagen": frozenset({"caddy", "taigo", "up!"}),
+}
+
+# Flat (make, model) view of EXCLUDED_CARS: one hashed lookup per listing
+# instead of a dict probe followed by a set probe.
+EXCLUDED_CARS_SET = frozenset(
+    (make, model) for make, models in EXCLUDED_CARS.items() for model in models
+)
+
+# First-level pre-check for the common negative case: most listings are not
+# from an excluded make at all, so a miss here skips building and hashing
+# the (make, model) tuple entirely.
+EXCLUDED_MAKES = frozenset(EXCLUDED_CARS)
+
+# (make, model) pairs that earn the "coolness" bonus. A model of "x" means
+# any model of that make counts.
+FAVORITE_MODELS = [
+    ("audi", "a4"),
+    ("bmw", "x"),
+    ("ford", "focus"),
+    ("honda", "civic"),
+    ("hyundai", "i30"),
+    ("kia", "ceed"),
+    ("mazda", "3"),
+    ("mazda", "6"),
+    ("seat", "leon"),
+    ("skoda", "octavia"),
+    ("skoda", "superb"),
+    ("toyota", "corolla"),
+    ("toyota", "yaris"),
+    ("volkswagen", "golf"),
+    ("volkswagen", "passat"),
+    ("volvo", "v60"),
+    ("volvo", "x"),
+]
+
+# Set views of FAVORITE_MODELS built once so per-row membership checks are
+# O(1) hash lookups instead of list scans. Wildcard entries (model "x")
+# mean every model of that make counts, so they get their own make set.
+FAVORITE_EXACT = frozenset(
+    (make, model) for make, model in FAVORITE_MODELS if model != "x"
+)
+FAVORITE_WILDCARD_MAKES = frozenset(
+    make for make, model in FAVORITE_MODELS if model == "x"
+)
+
+# Scores per (lowercase) fuel type; unknown types score 0.
+FUEL_SCORES = {
+    "electric": 5,
+    "electric/gasoline": 4,
+    "electric/diesel": 3,
+    "gasoline": 2,
+    "cng": 2,
+    "lpg": 1,
+    "diesel": 1,
+}
+
+# Weights for each scoring component in AutoScore.
+WEIGHTS = {
+    "price": 10,
+    "mileage": 8,
+    "year": 6,
+    "power": 5,
+    "coolness": 3,
+    "features": 2,
+    "body_type": 2,
+    "emission_class": 2,
+    "warranty": 2,
+    "fuel_type": 1,
+}
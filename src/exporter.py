@@ -0,0 +1,49 @@
+"""Exporting scraped car data to disk."""
+
+import csv
+import os
+
+import pandas as pd
+
+
+class Exporter:
+    """Writes a list of scraped car dicts out as a CSV file."""
+
+    def __init__(self, cars):
+        self.cars = cars
+
+    def export_to_csv(self, filename):
+        """Write all cars to ``filename``, creating parent folders as needed."""
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if isinstance(self.cars, list) and self.cars:
+            # The scraper hands over a list of uniform dicts; streaming them
+            # through DictWriter skips the DataFrame allocation entirely.
+            with open(filename, "w", newline="", encoding="utf-8") as csv_file:
+                # unix dialect for bare \n line endings, with minimal quoting
+                # so numeric cells are written without escape logic.
+                writer = csv.DictWriter(
+                    csv_file,
+                    fieldnames=self.cars[0].keys(),
+                    dialect="unix",
+                    quoting=csv.QUOTE_MINIMAL,
+                )
+                writer.writeheader()
+                writer.writerows(self.cars)
+            return
+        pd.DataFrame(self.cars).to_csv(filename, index=False)
+
+    def export_to_parquet(self, filename):
+        """Write all cars as Parquet, the fast path for machine consumption.
+
+        Columnar compression shrinks the numeric columns and the format
+        round-trips dtypes, so reloading skips CSV type inference. CSV
+        export remains for eyeballing results.
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        pd.DataFrame(self.cars).to_parquet(
+            filename, engine="pyarrow", compression="snappy"
+        )
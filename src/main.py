@@ -0,0 +1,48 @@
+"""Entry point: scrape, score and notify in one run."""
+
+import argparse
+import logging
+
+import pandas as pd
+
+from src.autoscore import AutoScore
+from src.config import Config
+from src.exporter import Exporter
+from src.notifier import Notifier
+from src.scraper import Scraper
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SORT_METHODS = ["standard", "price", "age"]
+
+
+def main(write_csv=False):
+    config = Config()
+    # One scraper runs all sort passes over a single session and event
+    # loop, so the passes share the connection pool, rate limiter and
+    # seen-URL dedup instead of refetching overlapping listings.
+    results = Scraper(config).scrape_many(SORT_METHODS)
+    frames = {}
+    for sort_method, cars in results.items():
+        frames[sort_method] = pd.DataFrame(cars)
+        if write_csv:
+            Exporter(cars).export_to_csv(
+                f"{config.results_folder}/filtered_cars_{sort_method}.csv"
+            )
+    scorer = AutoScore.from_frames(frames)
+    top_cars = scorer.rank_cars(config.num_best_cars)
+    scorer.save_best_cars(top_cars, config.best_cars_file)
+    notifier = Notifier(config)
+    notifier.send_email(top_cars)
+    logger.info("Run complete: %d cars ranked", len(top_cars))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--write-csv",
+        action="store_true",
+        help="also persist the raw per-sort results as CSV",
+    )
+    main(write_csv=parser.parse_args().write_csv)
@@ -0,0 +1,78 @@
+"""Email notifications for the best cars found in a run."""
+
+import logging
+import smtplib
+from email.message import EmailMessage
+
+import numpy as np
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+TABLE_COLUMNS = ["make", "model", "price", "mileage", "year", "score", "grade", "url"]
+
+
+class Notifier:
+    """Sends the ranked cars table to the configured receiver via SMTP."""
+
+    def __init__(self, config=None):
+        self.config = config or Config()
+        self._smtp = None
+
+    def __enter__(self):
+        """Open one SMTP connection to reuse across multiple sends.
+
+        The TLS handshake and login dominate the cost of a send, so callers
+        issuing several notifications should use the context-manager form.
+        """
+        settings = self.config.email_settings
+        self._smtp = smtplib.SMTP(settings["smtp_server"], settings["smtp_port"])
+        self._smtp.starttls()
+        self._smtp.login(settings["sender"], settings["password"])
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self._smtp.quit()
+        finally:
+            self._smtp = None
+
+    def build_table_html(self, cars_df):
+        """Render the cars DataFrame as an HTML table for the email body."""
+        cars_df = cars_df.copy()
+        cars_df["url"] = '<a href="' + cars_df["url"].astype(str) + '">Link</a>'
+        highlights = np.where(
+            cars_df["score"].to_numpy() > 24, "background-color: yellow;", ""
+        )
+        columns = [cars_df[column].to_numpy() for column in TABLE_COLUMNS]
+        parts = ["<table border='1' cellpadding='4'><tr>"]
+        parts.extend(f"<th>{column}</th>" for column in TABLE_COLUMNS)
+        parts.append("</tr>")
+        for highlight, *values in zip(highlights, *columns):
+            parts.append(f"<tr style='{highlight}'>")
+            parts.extend(f"<td>{value}</td>" for value in values)
+            parts.append("</tr>")
+        parts.append("</table>")
+        return "".join(parts)
+
+    def send_email(self, cars_df, subject="Your best car deals"):
+        """Send an HTML email with the ranked cars to the configured address."""
+        settings = self.config.email_settings
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = settings["sender"]
+        message["To"] = settings["receiver"]
+        body = f"<html><body><h2>{subject}</h2>{self.build_table_html(cars_df)}</body></html>"
+        # HTML-only body as the root part: no multipart wrapper to serialize.
+        message.set_content(body, subtype="html")
+        if self._smtp is not None:
+            self._smtp.send_message(message)
+        else:
+            with smtplib.SMTP(
+                settings["smtp_server"], settings["smtp_port"]
+            ) as server:
+                server.starttls()
+                server.login(settings["sender"], settings["password"])
+                server.send_message(message)
+        logger.info("Notification email sent to %s", settings["receiver"])
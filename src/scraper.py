@@ -0,0 +1,470 @@
+"""Scraper for AutoScout24 listing and detail pages."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlencode
+
+import aiohttp
+import requests
+import requests_cache
+from aiolimiter import AsyncLimiter
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from tqdm.asyncio import tqdm_asyncio
+
+from src.config import Config
+from src.constants import EXCLUDED_CARS_SET, EXCLUDED_MAKES
+from src.utils import load_makes_from_csv
+
+logger = logging.getLogger(__name__)
+
+# On-disk HTTP cache for the synchronous session: detail pages barely
+# change within an hour, so re-runs and resumed runs skip the network.
+HTTP_CACHE = "data/http_cache"
+HTTP_CACHE_EXPIRY = 3600  # seconds
+
+# Statuses worth retrying with backoff: rate limiting and transient
+# server-side failures.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Strips currency signs, separators and unit suffixes from numeric fields
+# in one pass, instead of a chain of str.replace allocations.
+_DIGITS_ONLY = str.maketrans("", "", "€,. km")
+
+# Spec-grid labels mapped to result keys, shared by every detail page;
+# building these per call cost ~25 dict allocations per page.
+_DETAILS_MAPPING = {
+    "Body type": "body_type",
+    "Type": "type",
+    "Seats": "seats",
+    "Doors": "doors",
+    "Country version": "country_version",
+    "Offer number": "offer_number",
+    "Warranty": "warranty",
+    "Mileage": "vehicle_mileage",
+    "First registration": "first_registration",
+    "Previous owner": "previous_owner",
+    "Full service history": "full_service_history",
+    "Non-smoker vehicle": "non_smoker_vehicle",
+    "Power": "power",
+    "Gearbox": "gearbox",
+    "Engine size": "engine_size",
+    "Gears": "gears",
+    "Cylinders": "cylinders",
+    "Fuel type": "fuel_type",
+    "Emission class": "emission_class",
+}
+_INT_KEYS = frozenset({"Seats", "Doors", "Previous owner"})
+_DEFAULT_ADDITIONAL = {key: None for key in _DETAILS_MAPPING.values()}
+_DEFAULT_ADDITIONAL.update(
+    {
+        "android_auto": False,
+        "car_play": False,
+        "cruise_control": False,
+        "adaptive_cruise_control": False,
+        "seat_heating": False,
+        "image_url": None,
+    }
+)
+
+# Equipment list items are matched by substring against these tables; the
+# cruise flags are ordered so "Adaptive Cruise Control" wins before the
+# plain "Cruise Control" substring also matches.
+_EQUIPMENT_FLAGS = {
+    "Android Auto": "android_auto",
+    "Apple CarPlay": "car_play",
+    "Seat heating": "seat_heating",
+}
+_CRUISE_FLAGS = {
+    "Adaptive Cruise Control": "adaptive_cruise_control",
+    "Cruise Control": "cruise_control",
+}
+
+# All detail-page sections holding dt/dd spec grids, matched in one CSS
+# pass instead of one lookup per section.
+_DETAIL_SECTIONS_SELECTOR = ", ".join(
+    f"section#{section_id}"
+    for section_id in (
+        "basic-details-section",
+        "listing-history-section",
+        "technical-details-section",
+        "environment-details-section",
+    )
+)
+
+
+class Scraper:
+    """Scrapes car listings according to the filters in :class:`Config`."""
+
+    def __init__(self, config=None):
+        self.config = config or Config()
+        self._mmmv_cache = None
+        # Detail URLs already processed this run; listings drifting across
+        # pages between requests would otherwise be fetched twice.
+        self._seen_urls = set()
+        # Parsed detail dicts keyed by body hash: HTTP-cache hits and
+        # ad-variant pages sharing a body skip the parse entirely.
+        self._parse_memo = {}
+        # Keep-alive session for the synchronous path: all requests hit the
+        # same host, so pooled connections skip the TCP/TLS handshake, and
+        # responses are cached on disk so repeated runs within the expiry
+        # window cost no network at all. A forced refresh is
+        # ``self.session.cache.clear()``.
+        cache_dir = os.path.dirname(HTTP_CACHE)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.session = requests_cache.CachedSession(
+            HTTP_CACHE,
+            backend="sqlite",
+            expire_after=HTTP_CACHE_EXPIRY,
+            allowable_methods=("GET",),
+        )
+        self.session.headers.update(
+            {
+                "User-Agent": "carapi/1.0",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=1.0,
+                    status_forcelist=list(_RETRY_STATUSES),
+                    respect_retry_after_header=True,
+                ),
+            ),
+        )
+
+    def _brands_mmmv(self):
+        """The encoded make-filter segment, evaluated once per brand list.
+
+        Every page of every sort method shares the same brands, so the CSV
+        lookup and string build happen once and are reused until the
+        configured brand list changes.
+        """
+        brands = tuple(self.config.filters.get("brands") or ())
+        if not brands:
+            return None
+        if self._mmmv_cache is None or self._mmmv_cache[0] != brands:
+            makes_mapping = load_makes_from_csv()
+            mmmv = ",".join(
+                f"{make_id}|||"
+                for brand in brands
+                if (make_id := makes_mapping.get(brand.lower()))
+            )
+            self._mmmv_cache = (brands, mmmv)
+        return self._mmmv_cache[1]
+
+    def _build_base_params(self, sort_method):
+        """Build the query params shared by every page of one scrape run."""
+        filters = self.config.filters
+        params = {
+            "atype": "C",
+            "cy": "D",
+            "damaged_listing": "exclude",
+            "powertype": "hp",
+            "pricefrom": filters.get("min_price", 0),
+            "priceto": filters.get("max_price", 100000),
+            "fregfrom": filters.get("min_year", 2000),
+            "kmto": filters.get("max_mileage", 500000),
+            "sort": sort_method,
+        }
+        mmmv = self._brands_mmmv()
+        if mmmv:
+            params["mmmv"] = mmmv
+        return params
+
+    def _url_for_page(self, base_params, page):
+        """Append the page number to the shared params and encode the URL."""
+        return f"{self.config.base_url}/lst?{urlencode({**base_params, 'page': page})}"
+
+    def construct_url(self, page, sort_method="standard"):
+        """Build the listing-page URL for the given page and sort order."""
+        return self._url_for_page(self._build_base_params(sort_method), page)
+
+    def scrape_data(self, sort_method="standard"):
+        """Scrape all configured listing pages and their detail pages."""
+        return self.scrape_many([sort_method])[sort_method]
+
+    def scrape_many(self, sort_methods):
+        """Scrape several sort-method passes through one shared session.
+
+        Returns a dict mapping each sort method to its list of cars. All
+        passes share the connection pool, the rate limiter and the
+        seen-URL set, so listings surfacing under several sort orders are
+        fetched once instead of once per pass.
+        """
+        return asyncio.run(self._scrape_many_async(sort_methods))
+
+    async def _scrape_many_async(self, sort_methods):
+        timeout = aiohttp.ClientTimeout(total=10)
+        connector = aiohttp.TCPConnector(limit=10)
+        # Token bucket pacing the request rate; the connector caps how many
+        # are in flight at once. Together they replace blind sleeps.
+        limiter = AsyncLimiter(10, 1.0)
+        async with aiohttp.ClientSession(
+            timeout=timeout, connector=connector
+        ) as session:
+            results = await asyncio.gather(
+                *(
+                    self._scrape_sort(session, limiter, sort_method)
+                    for sort_method in sort_methods
+                )
+            )
+        return dict(zip(sort_methods, results))
+
+    async def _scrape_sort(self, session, limiter, sort_method):
+        """Fetch one sort pass's listing pages and their detail pages.
+
+        The run is network-bound: listing pages are fetched up front and
+        every page's detail requests are dispatched together, paced by the
+        shared limiter. Pages are processed as independent tasks, so one
+        page's detail round trips never gate another's.
+        """
+        base_params = self._build_base_params(sort_method)
+        page_urls = [
+            self._url_for_page(base_params, page)
+            for page in range(1, self.config.num_pages + 1)
+        ]
+        pages = await asyncio.gather(
+            *(self._fetch(session, limiter, url) for url in page_urls)
+        )
+        page_cars = await tqdm_asyncio.gather(
+            *(self._process_page(session, limiter, html) for html in pages),
+            desc=f"Scraping pages ({sort_method})",
+        )
+        return [car for cars in page_cars for car in cars]
+
+    async def _process_page(self, session, limiter, html):
+        """Turn one listing page into car dicts, fetching its detail pages."""
+        summaries = self._extract_listing_summaries(html)
+        detail_pages = await asyncio.gather(
+            *(
+                self._fetch(session, limiter, summary["url"])
+                for summary in summaries
+            ),
+            return_exceptions=True,
+        )
+        scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cars = []
+        for summary, detail_html in zip(summaries, detail_pages):
+            if isinstance(detail_html, Exception):
+                logger.error(
+                    "Error fetching details for %s: %s",
+                    summary["url"],
+                    detail_html,
+                )
+                continue
+            car_data = dict(summary)
+            car_data.update(self._parse_car_details(detail_html))
+            car_data["scraped_at"] = scraped_at
+            cars.append(car_data)
+        return cars
+
+    @staticmethod
+    @retry(
+        wait=wait_exponential(multiplier=0.5, max=30),
+        stop=stop_after_attempt(3),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        reraise=True,
+    )
+    async def _fetch(session, limiter, url, retries=3):
+        """Fetch one URL, returning the body bytes or raising on bad status.
+
+        The limiter paces requests; connection errors and timeouts retry
+        with exponential backoff via tenacity, while rate-limit and
+        transient server statuses are retried inline, honouring
+        ``Retry-After`` when the server sends one. Healthy responses incur
+        no delay at all.
+        """
+        async with limiter:
+            for attempt in range(retries + 1):
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        # Raw bytes: both parsers consume them directly, so
+                        # the full-body str decode is skipped entirely.
+                        return await response.read()
+                    if response.status not in _RETRY_STATUSES or attempt == retries:
+                        raise requests.exceptions.RequestException(
+                            f"Failed to fetch {url}: status {response.status}"
+                        )
+                    retry_after = response.headers.get("Retry-After")
+                delay = 2**attempt + random.uniform(0, 1)
+                if retry_after is not None:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                await asyncio.sleep(delay)
+
+    def _extract_listing_summaries(self, html):
+        """Parse the per-listing summary attributes out of a listing page.
+
+        One Lexbor CSS pass selects the summary articles; each field is an
+        attribute read on the node, with no per-tag Python object built by
+        the parser. Excluded (make, model) pairs are dropped here, before
+        any detail page is requested for them.
+        """
+        summaries = []
+        tree = LexborHTMLParser(html)
+        for car in tree.css("article.cldt-summary-full-item"):
+            attrs = car.attributes
+            try:
+                raw_make = attrs.get("data-make")
+                raw_model = attrs.get("data-model")
+                car_make = raw_make.lower() if raw_make else ""
+                car_model = raw_model.lower() if raw_model else ""
+                if (
+                    car_make in EXCLUDED_MAKES
+                    and (car_make, car_model) in EXCLUDED_CARS_SET
+                ):
+                    continue
+                raw_price = attrs.get("data-price")
+                raw_mileage = attrs.get("data-mileage")
+                raw_registration = attrs.get("data-first-registration")
+                car_price = (
+                    int(raw_price.translate(_DIGITS_ONLY)) if raw_price else None
+                )
+                car_km = (
+                    int(raw_mileage.translate(_DIGITS_ONLY)) if raw_mileage else None
+                )
+                car_year = (
+                    int(raw_registration.split("-")[1]) if raw_registration else None
+                )
+                link = car.css_first("a.ListItem_title__ndA4s")
+                href = link.attributes.get("href") if link else None
+                full_url = f"{self.config.base_url}{href}" if href else None
+                if not full_url or full_url in self._seen_urls:
+                    continue
+                self._seen_urls.add(full_url)
+                summaries.append(
+                    {
+                        "make": car_make,
+                        "model": car_model,
+                        "price": car_price,
+                        "mileage": car_km,
+                        "year": car_year,
+                        "url": full_url,
+                    }
+                )
+            except Exception as error:  # noqa: BLE001 - one bad listing must not kill the page
+                logger.error("Error extracting data for a car: %s", error)
+        return summaries
+
+    def extract_car_data(self, html):
+        """Extract the full data for every listing on a page, synchronously.
+
+        Takes the raw listing-page HTML (str or bytes), like the async path.
+        """
+        cars = []
+        # One timestamp per page: cheaper than strftime per car, and all
+        # cars on a page belong to the same scrape moment anyway.
+        scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        summaries = self._extract_listing_summaries(html)
+        if not summaries:
+            return cars
+        # Detail fetches are pure I/O waits, so threads overlap them; the
+        # pooled session is thread-safe and hands each worker a connection.
+        with ThreadPoolExecutor(max_workers=min(10, len(summaries))) as executor:
+            futures = [
+                executor.submit(self.scrape_car_details, summary["url"])
+                for summary in summaries
+            ]
+            for summary, future in zip(summaries, futures):
+                try:
+                    car_data = dict(summary)
+                    car_data.update(future.result())
+                    car_data["scraped_at"] = scraped_at
+                    cars.append(car_data)
+                except Exception as error:  # noqa: BLE001 - one bad listing must not kill the page
+                    logger.error("Error extracting data for a car: %s", error)
+        return cars
+
+    def scrape_car_details(self, url):
+        """Fetch a detail page and extract specs, equipment and the image."""
+        response = self.session.get(url, timeout=10)
+        if response.status_code != 200:
+            raise requests.exceptions.RequestException(
+                f"Failed to fetch car details: status {response.status_code}"
+            )
+        return self._parse_car_details(response.content)
+
+    def _parse_car_details(self, html):
+        """Extract specs, equipment and the image from a detail page.
+
+        Detail pages are parsed with selectolax's Lexbor backend, which
+        builds its tree in C; the handful of lookups done here are plain
+        CSS queries against it. Results are memoized by body hash; callers
+        treat the returned dict as read-only.
+        """
+        body = html if isinstance(html, bytes) else html.encode("utf-8")
+        memo_key = hashlib.sha1(body).digest()
+        memoized = self._parse_memo.get(memo_key)
+        if memoized is not None:
+            return memoized
+        tree = LexborHTMLParser(html)
+        additional_details = _DEFAULT_ADDITIONAL.copy()
+
+        for section in tree.css(_DETAIL_SECTIONS_SELECTOR):
+            self.extract_details(section, _DETAILS_MAPPING, additional_details)
+
+        equipment_section = tree.css_first("section#equipment-section")
+        if equipment_section:
+            for item in equipment_section.css("li"):
+                text = item.text()
+                for needle, flag in _EQUIPMENT_FLAGS.items():
+                    if needle in text:
+                        additional_details[flag] = True
+                for needle, flag in _CRUISE_FLAGS.items():
+                    if needle in text:
+                        additional_details[flag] = True
+                        break
+
+        source = tree.css_first(
+            "div.image-gallery-slides source[type='image/jpeg']"
+        )
+        if source:
+            srcset = source.attributes.get("srcset")
+            if srcset:
+                additional_details["image_url"] = srcset.split(",")[0].strip()
+
+        self._parse_memo[memo_key] = additional_details
+        return additional_details
+
+    def extract_details(self, section, details_mapping, additional_details):
+        """Pull dt/dd pairs out of one detail-page section into the result dict."""
+        for data_grid in section.css("dl.DataGrid_defaultDlStyle__xlLi_"):
+            keys = data_grid.css("dt")
+            values = data_grid.css("dd")
+            for key_el, value_el in zip(keys, values):
+                key = key_el.text().strip()
+                if key not in details_mapping:
+                    continue
+                value = value_el.text().strip()
+                if key in _INT_KEYS:
+                    try:
+                        value = int(value)
+                    except ValueError:
+                        value = None
+                elif key == "Mileage":
+                    try:
+                        value = int(value.translate(_DIGITS_ONLY))
+                    except ValueError:
+                        value = None
+                additional_details[details_mapping[key]] = value
@@ -0,0 +1,131 @@
+"""Helpers for fetching and storing the AutoScout24 makes/models taxonomy."""
+
+import csv
+import functools
+import json
+import logging
+import os
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+from src.constants import FILTER_MAKES_SET
+
+logger = logging.getLogger(__name__)
+
+MAKES_URL = "https://www.autoscout24.com/as24-home/api/taxonomy/cars/makes"
+MAKES_CSV = "data/makes_and_models.csv"
+MAKES_CACHE = "data/makes_cache.json"
+MAKES_CACHE_ETAG = "data/makes_cache.etag"
+MAKES_CACHE_MAX_AGE = 24 * 3600  # seconds before we revalidate with the API
+
+# Shared session: keep-alive reuses the TCP/TLS connection across API calls
+# and retries transient failures with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3))
+)
+
+
+def _read_makes_cache():
+    try:
+        with open(MAKES_CACHE, "rb") as cache_file:
+            raw = cache_file.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+def fetch_makes_and_models():
+    """Fetch the full makes/models taxonomy from the AutoScout24 API.
+
+    The taxonomy changes rarely, so the response is cached on disk: a cache
+    younger than ``MAKES_CACHE_MAX_AGE`` is served without any HTTP at all,
+    and an older one is revalidated with If-None-Match so a 304 skips the
+    re-download.
+    """
+    try:
+        cache_age = time.time() - os.path.getmtime(MAKES_CACHE)
+    except OSError:
+        cache_age = None
+    if cache_age is not None and cache_age < MAKES_CACHE_MAX_AGE:
+        cached = _read_makes_cache()
+        if cached is not None:
+            return cached
+    headers = {"accept": "application/json"}
+    try:
+        with open(MAKES_CACHE_ETAG, encoding="utf-8") as etag_file:
+            headers["If-None-Match"] = etag_file.read().strip()
+    except OSError:
+        pass
+    response = _SESSION.get(MAKES_URL, headers=headers, timeout=10)
+    if response.status_code == 304:
+        cached = _read_makes_cache()
+        if cached is not None:
+            os.utime(MAKES_CACHE)  # restart the max-age clock
+            return cached
+        # 304 but the cached body is missing or corrupt: the etag is
+        # orphaned and the 304 body is empty, so drop the validator and
+        # re-fetch unconditionally.
+        try:
+            os.remove(MAKES_CACHE_ETAG)
+        except OSError:
+            pass
+        headers.pop("If-None-Match", None)
+        response = _SESSION.get(MAKES_URL, headers=headers, timeout=10)
+    response.raise_for_status()
+    # orjson's scanner decodes the multi-hundred-KB taxonomy noticeably
+    # faster than stdlib json; fall back transparently when absent.
+    data = orjson.loads(response.content) if orjson else response.json()
+    cache_dir = os.path.dirname(MAKES_CACHE)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    with open(MAKES_CACHE, "w", encoding="utf-8") as cache_file:
+        json.dump(data, cache_file)
+    etag = response.headers.get("ETag")
+    if etag:
+        with open(MAKES_CACHE_ETAG, "w", encoding="utf-8") as etag_file:
+            etag_file.write(etag)
+    return data
+
+
+def save_makes_to_csv(data, filename=MAKES_CSV):
+    """Write the makes/models we care about to a CSV lookup file."""
+    def rows():
+        for make in data["makes"]:
+            make_name = make["name"]
+            if make_name not in FILTER_MAKES_SET:
+                continue
+            models = make.get("models") or [{"id": "", "name": ""}]
+            for model in models:
+                yield make["id"], make_name, model["id"], model["name"]
+
+    with open(filename, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["make_id", "make_name", "model_id", "model_name"])
+        writer.writerows(rows())
+
+
+@functools.lru_cache(maxsize=1)
+def load_makes_from_csv(filename=MAKES_CSV):
+    """Load the CSV written by :func:`save_makes_to_csv` into a name->id map.
+
+    Cached process-wide: every Scraper instance (one per sort method) asks
+    for the same mapping, and the file only changes when the taxonomy is
+    re-fetched. Call ``load_makes_from_csv.cache_clear()`` after rewriting
+    the CSV.
+    """
+    makes = (
+        pd.read_csv(filename, usecols=["make_name", "make_id"], dtype=str)
+        .dropna(subset=["make_name"])
+        .drop_duplicates("make_name")
+    )
+    return dict(zip(makes["make_name"].str.lower(), makes["make_id"]))
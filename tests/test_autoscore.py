@@ -0,0 +1,229 @@
+import pandas as pd
+import pytest
+
+from src.autoscore import GOOD_BODY_TYPES, AutoScore
+
+
+def make_car(**overrides):
+    car = {
+        "make": "toyota",
+        "model": "corolla",
+        "price": 10000,
+        "mileage": 50000,
+        "year": 2018,
+        "url": "https://example.com/car/1",
+        "power": "110 kW",
+        "fuel_type": "Gasoline",
+        "body_type": "Sedan",
+        "emission_class": "Euro 6",
+        "warranty": "12 months",
+        "previous_owner": 1,
+        "full_service_history": "Yes",
+        "non_smoker_vehicle": "Yes",
+        "android_auto": True,
+        "car_play": True,
+        "adaptive_cruise_control": False,
+        "seat_heating": True,
+        "vehicle_mileage": 50000,
+        "seats": 5,
+        "doors": 5,
+        "gears": 6,
+        "cylinders": 4,
+        "gearbox": "Manual",
+        "engine_size": "1,798 cc",
+        "type": "Used",
+        "country_version": "Germany",
+        "offer_number": "123",
+        "first_registration": "06-2018",
+        "image_url": "",
+        "scraped_at": "2024-01-01 10:00:00",
+    }
+    car.update(overrides)
+    return car
+
+
+@pytest.fixture
+def results_folder(tmp_path):
+    cars = [
+        make_car(),
+        make_car(
+            make="fiat",
+            model="panda",
+            price=18000,
+            mileage=140000,
+            year=2015,
+            url="https://example.com/car/2",
+            fuel_type="Diesel",
+            emission_class="Euro 5",
+            body_type="Compact",
+            warranty="No",
+            full_service_history="No",
+            non_smoker_vehicle="No",
+            android_auto=False,
+            car_play=False,
+            seat_heating=False,
+            previous_owner=3,
+        ),
+        make_car(url="https://example.com/car/1"),  # duplicate url
+        make_car(
+            model="yaris",
+            price=9000,
+            url="https://example.com/car/3",
+        ),
+    ]
+    folder = tmp_path / "results"
+    folder.mkdir()
+    pd.DataFrame(cars).to_csv(folder / "filtered_cars_standard.csv", index=False)
+    return folder
+
+
+def test_init_deduplicates_urls(results_folder):
+    scorer = AutoScore(str(results_folder))
+    assert len(scorer.data) == 3
+    assert scorer.data["url"].is_unique
+
+
+def test_init_handles_many_shards(results_folder):
+    # More than 8 shards switches loading to the pyarrow dataset path.
+    source = results_folder / "filtered_cars_standard.csv"
+    for i in range(9):
+        (results_folder / f"shard_{i}.csv").write_text(source.read_text())
+    scorer = AutoScore(str(results_folder))
+    assert len(scorer.data) == 3
+    assert scorer.data["url"].is_unique
+
+
+def test_from_frames_matches_csv_load(results_folder):
+    frames = {"standard": pd.read_csv(results_folder / "filtered_cars_standard.csv")}
+    from_frames = AutoScore.from_frames(frames)
+    from_csv = AutoScore(str(results_folder))
+    assert len(from_frames.data) == len(from_csv.data)
+    ranked_frames = from_frames.rank_cars(num_cars=3)
+    ranked_csv = from_csv.rank_cars(num_cars=3)
+    assert ranked_frames["url"].tolist() == ranked_csv["url"].tolist()
+
+
+def test_init_raises_without_csv(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        AutoScore(str(tmp_path))
+
+
+def test_normalize_bounds(results_folder):
+    scorer = AutoScore(str(results_folder))
+    assert scorer.normalize(scorer.price_min, scorer.price_min, scorer.price_max) == 1.0
+    assert scorer.normalize(scorer.price_max, scorer.price_min, scorer.price_max) == 0.0
+    assert scorer.normalize(5, 5, 5) == 1.0
+
+
+def test_rank_cars_orders_by_score(results_folder):
+    scorer = AutoScore(str(results_folder))
+    ranked = scorer.rank_cars(num_cars=3)
+    scores = ranked["score"].tolist()
+    assert scores == sorted(scores, reverse=True)
+    assert "grade" in ranked.columns
+    # The cheap, well-equipped favorite should beat the expensive diesel.
+    assert ranked.iloc[0]["make"] == "toyota"
+
+
+def test_rank_cars_prefers_unique_models(results_folder):
+    scorer = AutoScore(str(results_folder))
+    ranked = scorer.rank_cars(num_cars=3)
+    assert len(ranked.drop_duplicates(subset=["make", "model"])) == len(ranked)
+
+
+def reference_score(scorer, car):
+    """Plain per-row scorer kept as an oracle for the vectorized path."""
+    score = 0.0
+    score += scorer.weights["price"] * scorer.normalize(
+        car["price"], scorer.price_min, scorer.price_max
+    )
+    score += scorer.weights["mileage"] * scorer.normalize(
+        car["mileage"], scorer.mileage_min, scorer.mileage_max
+    )
+    power_parts = str(car["power"]).split()
+    power_hp = int(power_parts[0]) if power_parts and power_parts[0].isdigit() else 0
+    score += scorer.weights["power"] * scorer.normalize(
+        power_hp, scorer.power_min, scorer.power_max
+    )
+    score += scorer.weights["year"] * scorer.normalize(
+        car["year"], scorer.year_min, scorer.year_max
+    )
+    score += scorer.weights["fuel_type"] * scorer.fuel_scores.get(
+        str(car["fuel_type"]).lower(), 0
+    )
+    if car["android_auto"] and car["car_play"]:
+        score += scorer.weights["features"]
+    if car["adaptive_cruise_control"]:
+        score += 1
+    if car["seat_heating"]:
+        score += 1
+    if str(car["body_type"]).lower() in GOOD_BODY_TYPES:
+        score += scorer.weights["body_type"]
+    emission = str(car["emission_class"]).lower()
+    if "6" in emission:
+        score += scorer.weights["emission_class"]
+    elif "5" in emission:
+        score += scorer.weights["emission_class"] * 0.8
+    make_lower = str(car["make"]).lower()
+    model_lower = str(car["model"]).lower()
+    if (
+        (make_lower, model_lower) in scorer._fav_exact
+        or make_lower in scorer._fav_wildcard_makes
+    ):
+        score += scorer.weights["coolness"]
+    if "no" not in str(car["warranty"]).lower():
+        score += scorer.weights["warranty"]
+    if car["previous_owner"] == 1:
+        score += 1
+    elif car["previous_owner"] == 2:
+        score += 1.5
+    if "no" in str(car["full_service_history"]).lower():
+        score -= 2
+    if "no" in str(car["non_smoker_vehicle"]).lower():
+        score -= 1
+    return score
+
+
+def test_vectorized_score_matches_reference(results_folder):
+    scorer = AutoScore(str(results_folder))
+    vectorized = scorer._vectorized_score(scorer.data)
+    row_wise = scorer.data.apply(lambda car: reference_score(scorer, car), axis=1)
+    # float32 storage introduces rounding well below the 0.1 display step.
+    assert (vectorized - row_wise).abs().max() < 1e-5
+
+
+def test_assign_grade_boundaries(results_folder):
+    scorer = AutoScore(str(results_folder))
+    assert scorer.assign_grade(5) == "Bad"
+    assert scorer.assign_grade(12) == "Not Good"
+    assert scorer.assign_grade(17) == "Decent"
+    assert scorer.assign_grade(22) == "Good"
+    assert scorer.assign_grade(26) == "Excellent"
+    assert scorer.assign_grade(30) == "Outstanding"
+
+
+def test_save_best_cars_appends(results_folder, tmp_path):
+    scorer = AutoScore(str(results_folder))
+    best_file = tmp_path / "best_cars.csv"
+    top = scorer.rank_cars(num_cars=3)
+    scorer.save_best_cars(top, str(best_file))
+    scorer.save_best_cars(top, str(best_file))
+    # Appends are cheap; duplicates stay in the log until compaction.
+    assert len(pd.read_csv(best_file)) == 2 * len(top)
+
+
+def test_save_best_cars_compacts_oversized_log(results_folder, tmp_path):
+    scorer = AutoScore(str(results_folder))
+    best_file = tmp_path / "best_cars.csv"
+    top = scorer.rank_cars(num_cars=3)
+    for _ in range(3):
+        scorer.save_best_cars(top, str(best_file), max_rows=2)
+    saved = pd.read_csv(best_file)
+    assert len(saved) == 2
+    assert saved["url"].is_unique
+    assert saved["score"].tolist() == sorted(saved["score"], reverse=True)
+
+
+def test_get_all_time_best_missing_file(tmp_path):
+    best = AutoScore.get_all_time_best(str(tmp_path / "missing.csv"))
+    assert best.empty
@@ -0,0 +1,39 @@
+import json
+
+from src.config import Config, get_config
+
+
+def test_get_config_is_cached(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    get_config.cache_clear()
+    assert get_config() is get_config()
+    get_config.cache_clear()
+
+
+def test_defaults(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config()
+    assert config.num_pages == 3
+    assert config.filters["min_price"] == 3000
+    assert config.email_settings["smtp_port"] == 587
+
+
+def test_settings_file_overrides(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "settings.json").write_text(
+        json.dumps({"num_pages": 7, "filters": {"min_price": 5000}})
+    )
+    config = Config()
+    assert config.num_pages == 7
+    assert config.filters["min_price"] == 5000
+    assert config.filters["max_price"] == 20000  # untouched default
+
+
+def test_save_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config()
+    config.filters["max_price"] = 15000
+    config.save()
+    reloaded = Config()
+    assert reloaded.filters["max_price"] == 15000
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from src.exporter import Exporter
+
+
+def test_export_to_csv(tmp_path):
+    cars = [
+        {"make": "toyota", "model": "corolla", "price": 12000},
+        {"make": "mazda", "model": "3", "price": 14000},
+    ]
+    target = tmp_path / "nested" / "cars.csv"
+    Exporter(cars).export_to_csv(str(target))
+    saved = pd.read_csv(target)
+    assert len(saved) == 2
+    assert list(saved.columns) == ["make", "model", "price"]
+
+
+def test_export_to_parquet(tmp_path):
+    cars = [
+        {"make": "toyota", "model": "corolla", "price": 12000},
+        {"make": "mazda", "model": "3", "price": 14000},
+    ]
+    target = tmp_path / "cars.parquet"
+    Exporter(cars).export_to_parquet(str(target))
+    saved = pd.read_parquet(target)
+    assert len(saved) == 2
+    assert saved["price"].dtype.kind == "i"  # dtypes survive the round-trip
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from src.notifier import Notifier
+
+
+def make_cars_df():
+    return pd.DataFrame(
+        [
+            {
+                "make": "toyota",
+                "model": "corolla",
+                "price": 12000,
+                "mileage": 60000,
+                "year": 2018,
+                "score": 26.5,
+                "grade": "Excellent",
+                "url": "https://example.com/car/1",
+            },
+            {
+                "make": "fiat",
+                "model": "panda",
+                "price": 8000,
+                "mileage": 120000,
+                "year": 2015,
+                "score": 12.0,
+                "grade": "Not Good",
+                "url": "https://example.com/car/2",
+            },
+        ]
+    )
+
+
+def test_build_table_html_links_and_highlights():
+    html = Notifier().build_table_html(make_cars_df())
+    assert '<a href="https://example.com/car/1">Link</a>' in html
+    assert html.count("background-color: yellow;") == 1
+    assert "<th>make</th>" in html
+    assert "corolla" in html
@@ -0,0 +1,98 @@
+from src.config import Config
+from src.scraper import Scraper
+
+LISTING_HTML = """
+<html><body>
+<article class="cldt-summary-full-item" data-make="Toyota" data-model="Corolla"
+         data-price="€12,500" data-mileage="60,000 km" data-first-registration="06-2018">
+  <a class="ListItem_title__ndA4s" href="/offers/toyota-corolla-1">Toyota Corolla</a>
+</article>
+<article class="cldt-summary-full-item" data-make="Volkswagen" data-model="Caddy"
+         data-price="€9,000" data-mileage="90,000 km" data-first-registration="01-2016">
+  <a class="ListItem_title__ndA4s" href="/offers/vw-caddy-1">VW Caddy</a>
+</article>
+</body></html>
+"""
+
+DETAILS_HTML = """
+<html><body>
+<section id="basic-details-section">
+  <dl class="DataGrid_defaultDlStyle__xlLi_">
+    <dt>Body type</dt><dd>Sedan</dd>
+    <dt>Seats</dt><dd>5</dd>
+    <dt>Mileage</dt><dd>60,000 km</dd>
+    <dt>Irrelevant</dt><dd>ignored</dd>
+  </dl>
+</section>
+<section id="technical-details-section">
+  <dl class="DataGrid_defaultDlStyle__xlLi_">
+    <dt>Power</dt><dd>110 kW</dd>
+    <dt>Fuel type</dt><dd>Gasoline</dd>
+  </dl>
+</section>
+<section id="equipment-section">
+  <ul>
+    <li>Android Auto</li>
+    <li>Cruise Control</li>
+    <li>Seat heating</li>
+  </ul>
+</section>
+<div class="image-gallery-slides">
+  <source type="image/jpeg" srcset="https://img.example.com/car.jpg 1x, https://img.example.com/car2.jpg 2x">
+</div>
+</body></html>
+"""
+
+
+def make_scraper():
+    config = Config()
+    config.filters["brands"] = []
+    return Scraper(config)
+
+
+def test_construct_url_contains_filters():
+    scraper = make_scraper()
+    url = scraper.construct_url(page=2, sort_method="price")
+    assert url.startswith(scraper.config.base_url)
+    assert "page=2" in url
+    assert "sort=price" in url
+    assert f"pricefrom={scraper.config.filters['min_price']}" in url
+
+
+def test_extract_car_data_parses_and_excludes(monkeypatch):
+    scraper = make_scraper()
+    monkeypatch.setattr(scraper, "scrape_car_details", lambda url: {})
+    cars = scraper.extract_car_data(LISTING_HTML)
+    # The VW Caddy is in EXCLUDED_CARS and must be dropped.
+    assert len(cars) == 1
+    car = cars[0]
+    assert car["make"] == "toyota"
+    assert car["model"] == "corolla"
+    assert car["price"] == 12500
+    assert car["mileage"] == 60000
+    assert car["year"] == 2018
+    assert car["url"].endswith("/offers/toyota-corolla-1")
+    assert "scraped_at" in car
+
+
+def test_scrape_car_details_extracts_sections(monkeypatch):
+    scraper = make_scraper()
+
+    class FakeResponse:
+        status_code = 200
+        text = DETAILS_HTML
+        content = DETAILS_HTML.encode("utf-8")
+
+    monkeypatch.setattr(scraper.session, "get", lambda url, **kwargs: FakeResponse())
+    details = scraper.scrape_car_details("https://example.com/offers/1")
+    assert details["body_type"] == "Sedan"
+    assert details["seats"] == 5
+    assert details["vehicle_mileage"] == 60000
+    assert details["power"] == "110 kW"
+    assert details["fuel_type"] == "Gasoline"
+    assert details["android_auto"] is True
+    assert details["car_play"] is False
+    assert details["cruise_control"] is True
+    assert details["adaptive_cruise_control"] is False
+    assert details["seat_heating"] is True
+    assert details["image_url"] == "https://img.example.com/car.jpg 1x"
@@ -0,0 +1,31 @@
+from src.utils import load_makes_from_csv, save_makes_to_csv
+
+TAXONOMY = {
+    "makes": [
+        {
+            "id": "9",
+            "name": "Toyota",
+            "models": [
+                {"id": "90", "name": "Corolla"},
+                {"id": "91", "name": "Yaris"},
+            ],
+        },
+        {"id": "13", "name": "Lamborghini", "models": [{"id": "130", "name": "Urus"}]},
+        {"id": "47", "name": "Mazda", "models": None},
+    ]
+}
+
+
+def test_save_and_load_round_trip(tmp_path):
+    csv_file = tmp_path / "makes.csv"
+    save_makes_to_csv(TAXONOMY, str(csv_file))
+    mapping = load_makes_from_csv(str(csv_file))
+    assert mapping == {"toyota": "9", "mazda": "47"}
+
+
+def test_save_filters_unwanted_makes(tmp_path):
+    csv_file = tmp_path / "makes.csv"
+    save_makes_to_csv(TAXONOMY, str(csv_file))
+    content = csv_file.read_text()
+    assert "Lamborghini" not in content
+    assert "Corolla" in content